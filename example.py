@@ -1,7 +1,6 @@
 from sls_memory import Config
 from sls_memory.client import SLSMemoryClient
 import os
-import time
 
 def main():
     # 1. init memory store client
@@ -16,8 +15,6 @@ def main():
     result = client.create_memory_store()
     print(result)
 
-    time.sleep(60)
-
     # 3. add memory
     result = client.add(
         messages="我住在杭州，喜欢杭州的风景，经常会去西湖玩",
@@ -26,7 +23,8 @@ def main():
 
     print(result)
 
-    time.sleep(120)
+    # wait until the memory has been processed and is searchable
+    client.wait_until_indexed(user_id="user123")
 
     # 4. search memory
     result = client.search(
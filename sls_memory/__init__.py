@@ -28,16 +28,32 @@ Example:
     >>> print(results)
 """
 
-from sls_memory.client import SLSMemoryClient, AsyncSLSMemoryClient
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 from sls_memory.exceptions import ValidationError
 
-# Re-export Config from alibabacloud_tea_openapi for convenience
-from alibabacloud_tea_openapi.utils_models import Config
+if TYPE_CHECKING:
+    from alibabacloud_tea_openapi.utils_models import Config
+    from sls_memory.batching import BatchingWriter
+    from sls_memory.client import AsyncSLSMemoryClient, SLSMemoryClient
+
+# Public names imported on first access (PEP 562), so that `import sls_memory`
+# does not pull in the SLS SDK and alibabacloud_tea_openapi module graph.
+# Config is re-exported from alibabacloud_tea_openapi for convenience.
+_LAZY_ATTRS = {
+    "SLSMemoryClient": "sls_memory.client",
+    "AsyncSLSMemoryClient": "sls_memory.client",
+    "BatchingWriter": "sls_memory.batching",
+    "Config": "alibabacloud_tea_openapi.utils_models",
+}
 
 __all__ = [
     # Clients
     "SLSMemoryClient",
     "AsyncSLSMemoryClient",
+    # Batching
+    "BatchingWriter",
     # Config
     "Config",
     # Exceptions (only for SDK internal validation)
@@ -45,3 +61,16 @@ __all__ = [
 ]
 
 __version__ = "0.1.1"
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
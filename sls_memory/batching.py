@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+"""
+Client-side write batching for SLS Memory SDK.
+
+This module provides a writer that buffers ``add()`` calls and sends them to
+the SLS Memory service in batches, so callers that stream many memories pay
+one HTTP round trip per batch instead of one per memory. It also provides the
+scheduler used by AsyncSLSMemoryClient to coalesce concurrent ``add()`` calls.
+"""
+from __future__ import annotations
+
+import asyncio
+import atexit
+import collections
+import copy
+import threading
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple, Union
+
+from sls_memory.exceptions import ValidationError
+from sls_memory.messages import content_size, normalize_messages
+
+
+class BatchingWriter:
+    """Buffer memories and flush them to SLS in batches.
+
+    Memories are queued by ``add()`` and sent by a background thread. When the
+    thread is idle a queued memory is sent right away, so single-message latency
+    is preserved under low load; while a request is in flight, newly queued
+    memories accumulate and are coalesced into one request on the next send.
+
+    Consecutive memories added with ``infer=False`` that share the same scope
+    (user_id, agent_id, app_id, run_id and metadata) are merged into a single
+    ``add_memories`` call, bounded by ``max_batch_items`` messages and
+    ``max_batch_bytes`` bytes of message content. Memories added with
+    ``infer=True`` are always sent as their own request, since inference over
+    merged messages would change what is stored.
+
+    Example:
+        >>> from sls_memory import SLSMemoryClient, BatchingWriter
+        >>>
+        >>> client = SLSMemoryClient(config, project="my-project", memory_store="my-store")
+        >>> writer = BatchingWriter(client)
+        >>> for line in lines:
+        ...     writer.add(line, user_id="user123", infer=False)
+        >>> writer.flush()
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        max_batch_items: int = 500,
+        max_batch_bytes: int = 1024 * 1024,
+    ):
+        """Initialize the BatchingWriter.
+
+        Args:
+            client: The SLSMemoryClient used to send the batches.
+            max_batch_items: Maximum number of messages per request. Defaults to 500.
+            max_batch_bytes: Maximum size in bytes of message content per request.
+                            Defaults to 1 MiB.
+
+        Raises:
+            ValidationError: If the batch limits are not positive.
+        """
+        if max_batch_items <= 0:
+            raise ValidationError("max_batch_items must be positive")
+        if max_batch_bytes <= 0:
+            raise ValidationError("max_batch_bytes must be positive")
+
+        self._client = client
+        self._max_batch_items = max_batch_items
+        self._max_batch_bytes = max_batch_bytes
+        self._queue: Deque[Tuple[tuple, List[Dict[str, str]], int]] = collections.deque()
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._closed = False
+
+        self._thread = threading.Thread(
+            target=self._run,
+            name="sls-memory-batching-writer",
+            daemon=True,
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def add(
+        self,
+        messages: Union[str, Dict[str, str], List[Dict[str, str]]],
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        app_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        infer: bool = True,
+    ) -> None:
+        """Queue a memory to be added.
+
+        Takes the same arguments as ``SLSMemoryClient.add``. The memory is sent
+        asynchronously; call ``flush()`` to wait until it has been sent.
+
+        Raises:
+            ValidationError: If the writer is closed or messages has a wrong type.
+        """
+        if self._closed:
+            raise ValidationError("BatchingWriter is closed")
+        self._raise_pending_error()
+
+        messages = normalize_messages(messages)
+        scope = (user_id, agent_id, app_id, run_id, metadata, infer)
+        size = sum(map(content_size, messages))
+
+        with self._lock:
+            self._queue.append((scope, messages, size))
+        self._wakeup.set()
+
+    def add_many(
+        self,
+        messages: List[Union[str, Dict[str, str], List[Dict[str, str]]]],
+        **kwargs: Any,
+    ) -> None:
+        """Queue several memories sharing the same scope.
+
+        Args:
+            messages: A list of memories, each accepted by ``add()``.
+            **kwargs: Scope arguments passed to ``add()`` for every memory.
+
+        Example:
+            >>> writer.add_many(["I love tennis", "I live in Hangzhou"], user_id="user123")
+        """
+        for item in messages:
+            self.add(item, **kwargs)
+
+    def flush(self) -> None:
+        """Send all queued memories and wait until they have been sent.
+
+        A batch that fails is not retried, but it does not stop the batches
+        queued after it from being sent.
+
+        Raises:
+            Exception: The first error raised by a send since the last error
+                was reported, if any.
+        """
+        with self._send_lock:
+            while self._queue:
+                self._send(self._drain())
+        self._raise_pending_error()
+
+    def close(self) -> None:
+        """Flush queued memories and stop the background thread."""
+        if self._closed:
+            return
+        self._closed = True
+        # Release the writer, and through it the client and its credentials.
+        atexit.unregister(self.close)
+        self._wakeup.set()
+        self._thread.join()
+        self.flush()
+
+    def _raise_pending_error(self) -> None:
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _drain(self) -> List[Tuple[tuple, List[Dict[str, str]], int]]:
+        with self._lock:
+            items = list(self._queue)
+            self._queue.clear()
+        return items
+
+    def _send(self, items: List[Tuple[tuple, List[Dict[str, str]], int]]) -> None:
+        batch: List[Dict[str, str]] = []
+        batch_scope = None
+        batch_bytes = 0
+        for scope, messages, size in items:
+            infer = scope[-1]
+            # Only memories stored verbatim can share a request.
+            if batch and (
+                infer
+                or scope != batch_scope
+                or len(batch) + len(messages) > self._max_batch_items
+                or batch_bytes + size > self._max_batch_bytes
+            ):
+                self._send_batch(batch_scope, batch)
+                batch, batch_bytes = [], 0
+            batch_scope = scope
+            batch.extend(messages)
+            batch_bytes += size
+        if batch:
+            self._send_batch(batch_scope, batch)
+
+    def _send_batch(self, scope: tuple, messages: List[Dict[str, str]]) -> None:
+        user_id, agent_id, app_id, run_id, metadata, infer = scope
+        try:
+            self._client.add(
+                messages=messages,
+                user_id=user_id,
+                agent_id=agent_id,
+                app_id=app_id,
+                run_id=run_id,
+                metadata=metadata,
+                infer=infer,
+            )
+        except Exception as e:
+            # Keep sending the remaining batches; report the first failure.
+            if self._error is None:
+                self._error = e
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            with self._send_lock:
+                items = self._drain()
+                if items:
+                    self._send(items)
+
+
+class _BatchScheduler:
+    """Coalesce concurrent ``add()`` calls of an async client into batched requests.
+
+    Calls are queued with a per-call future. The queue is flushed once it holds
+    ``max_batch`` calls or ``max_delay`` seconds after the first queued call,
+    whichever comes first. Queued calls sharing the same scope are sent as one
+    request. When the response has one result per message, each caller's future
+    resolves to the slice of results for its own messages; otherwise every
+    caller receives the whole response.
+    """
+
+    def __init__(
+        self,
+        send: Callable[..., Awaitable[Dict[str, Any]]],
+        max_batch: int,
+        max_delay: float,
+    ):
+        self._send = send
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._pending: List[Tuple[Dict[str, Any], List[Any], "asyncio.Future[Any]"]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def submit(self, messages: List[Any], scope: Dict[str, Any]) -> Dict[str, Any]:
+        """Queue messages for sending and wait for the batched response."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((scope, messages, future))
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_delay, self._flush)
+        return copy.deepcopy(await future)
+
+    async def close(self) -> None:
+        """Send all queued calls and wait for the in-flight requests."""
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+
+        groups: List[Tuple[Dict[str, Any], List[Tuple[List[Any], "asyncio.Future[Any]"]]]] = []
+        for scope, messages, future in pending:
+            for group_scope, items in groups:
+                if group_scope == scope:
+                    items.append((messages, future))
+                    break
+            else:
+                groups.append((scope, [(messages, future)]))
+
+        for scope, items in groups:
+            task = asyncio.ensure_future(self._send_group(scope, items))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send_group(
+        self,
+        scope: Dict[str, Any],
+        items: List[Tuple[List[Any], "asyncio.Future[Any]"]],
+    ) -> None:
+        messages = [msg for batch, _ in items for msg in batch]
+        try:
+            result = await self._send(messages, **scope)
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, future), caller_result in zip(items, _split_results(result, items)):
+                if not future.done():
+                    future.set_result(caller_result)
+
+
+def _split_results(
+    result: Dict[str, Any],
+    items: List[Tuple[List[Any], "asyncio.Future[Any]"]],
+) -> List[Dict[str, Any]]:
+    """Split a batched response into one result per caller by message count."""
+    results = result.get("results")
+    counts = [len(messages) for messages, _ in items]
+    if not isinstance(results, list) or len(results) != sum(counts):
+        return [result] * len(items)
+
+    split = []
+    start = 0
+    for count in counts:
+        split.append({**result, "results": results[start:start + count]})
+        start += count
+    return split
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+Client-side result cache for SLS Memory SDK.
+
+This module provides a small LRU cache with TTL used by the clients to serve
+repeated read requests without a round trip to the SLS Memory service, and
+single-flight helpers that let concurrent identical requests share one call.
+"""
+from __future__ import annotations
+
+import asyncio
+import collections
+import copy
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+Scope = Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]
+
+# Scope of results that any write may affect, e.g. a memory fetched by ID.
+ANY_SCOPE: Scope = (None, None, None, None)
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a search query so trivially different spellings share a cache key.
+
+    Collapses runs of whitespace and folds case, e.g. ``"Where  do I live?"``
+    and ``"where do i live?"`` map to the same key.
+    """
+    return " ".join(query.split()).casefold()
+
+
+def _scope_overlaps(cached: Scope, written: Scope) -> bool:
+    """Return whether a write to ``written`` may change results cached for ``cached``.
+
+    A ``None`` filter matches any value, so a search without ``agent_id`` is
+    affected by writes for every agent.
+    """
+    return all(a is None or b is None or a == b for a, b in zip(cached, written))
+
+
+class ResultCache:
+    """Thread-safe LRU cache with TTL, invalidated by memory scope.
+
+    Entries are keyed by the (user_id, agent_id, app_id, run_id) scope of the
+    request plus a request-specific key. Writes invalidate every entry whose
+    scope overlaps the written scope. Values are deep-copied on the way in and
+    out so callers can freely mutate what they receive.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 60.0):
+        """Initialize the ResultCache.
+
+        Args:
+            maxsize: Maximum number of cached entries. Defaults to 128.
+            ttl: Time-to-live of an entry in seconds. Defaults to 60.
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: "collections.OrderedDict[Tuple[Scope, Hashable], Tuple[float, Any]]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, scope: Scope, key: Hashable) -> Optional[Any]:
+        """Return a copy of the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get((scope, key))
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._data[(scope, key)]
+                return None
+            self._data.move_to_end((scope, key))
+        return copy.deepcopy(value)
+
+    def put(self, scope: Scope, key: Hashable, value: Any) -> None:
+        """Cache a copy of value, evicting the least recently used entry if full."""
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._data[(scope, key)] = (time.monotonic() + self._ttl, value)
+            self._data.move_to_end((scope, key))
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, scope: Optional[Scope] = None) -> None:
+        """Drop entries affected by a write to scope, or all entries if scope is None."""
+        with self._lock:
+            if scope is None:
+                self._data.clear()
+                return
+            for cached_scope, key in list(self._data):
+                if _scope_overlaps(cached_scope, scope):
+                    del self._data[(cached_scope, key)]
+
+
+class _Call:
+    """An in-flight call shared by SingleFlight callers."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesce concurrent identical calls across threads.
+
+    While a call for a key is in flight, other callers with the same key wait
+    for it and receive a copy of its result (or its exception) instead of
+    issuing their own request.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Call func, or wait for the in-flight call with the same key."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class _LeaderCancelled(Exception):
+    """Raised to AsyncSingleFlight followers when the in-flight call was cancelled."""
+
+
+class AsyncSingleFlight:
+    """Coalesce concurrent identical calls within an event loop.
+
+    The asyncio counterpart of SingleFlight: callers with the same key await
+    the future of the in-flight call. If the caller running the call is
+    cancelled, one of the waiting callers runs it again for the others.
+    """
+
+    def __init__(self):
+        self._futures: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Await func(), or the in-flight call with the same key."""
+        future = self._futures.get(key)
+        while future is not None:
+            try:
+                return copy.deepcopy(await asyncio.shield(future))
+            except _LeaderCancelled:
+                # The first waiter to wake up takes over the call.
+                future = self._futures.get(key)
+
+        future = asyncio.get_running_loop().create_future()
+        self._futures[key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when no other caller is waiting.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            del self._futures[key]
+        return result
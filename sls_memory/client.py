@@ -7,13 +7,353 @@ to provide an interface compatible with mem0 SDK.
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+import random
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, Union
 
 from alibabacloud_sls20201230.client import Client as SLSClient
 from alibabacloud_sls20201230 import models as sls_models
 from alibabacloud_tea_openapi import utils_models as openapi_models
 
+from sls_memory.batching import _BatchScheduler
+from sls_memory.cache import (
+    ANY_SCOPE,
+    AsyncSingleFlight,
+    ResultCache,
+    SingleFlight,
+    normalize_query,
+)
 from sls_memory.exceptions import ValidationError
+from sls_memory.messages import (
+    DEFAULT_ROLE,
+    chunk_messages,
+    normalize_batch,
+    normalize_messages,
+)
+
+# Seconds add() keeps retrying while the Memory Store is reported missing, unless
+# the client has just created it (see ``store_ready_timeout``).
+_NOT_FOUND_GRACE = 1.5
+
+# HTTP status codes safe to retry for non-idempotent writes: the request was
+# rejected before being processed. 502/504 are excluded, since the gateway may
+# time out after the service has already stored the memory.
+_RETRYABLE_STATUS_CODES = frozenset({429, 503})
+
+
+# SLS SDK clients shared by all memory clients built from equivalent configs.
+# Entries are dropped once no memory client uses them, so rotated credentials
+# (e.g. STS tokens) do not accumulate clients or secrets for the process lifetime.
+_CLIENT_POOL: "weakref.WeakValueDictionary[Tuple[Hashable, ...], SLSClient]" = (
+    weakref.WeakValueDictionary()
+)
+_CLIENT_POOL_LOCK = threading.Lock()
+
+
+def _config_key(config: openapi_models.Config) -> Tuple[Hashable, ...]:
+    """Build a hashable key identifying every setting of an SLS SDK config."""
+    items = []
+    for name, value in sorted(vars(config).items()):
+        # `type` is derived from the credentials by SLSClient itself.
+        if name == "type":
+            continue
+        try:
+            hash(value)
+        except TypeError:
+            value = repr(value)
+        items.append((name, value))
+    return (type(config), tuple(items))
+
+
+def _get_sls_client(config: openapi_models.Config) -> SLSClient:
+    """Return the shared SLS SDK client for config, creating it on first use.
+
+    Clients are shared only between configs with identical settings, including
+    credentials, endpoint and timeouts. Credential objects are compared by
+    identity. A client stays in the pool only while a memory client holds it.
+    """
+    key = _config_key(config)
+    with _CLIENT_POOL_LOCK:
+        client = _CLIENT_POOL.get(key)
+        if client is None:
+            client = _CLIENT_POOL[key] = SLSClient(config)
+        return client
+
+
+def _require(value: Any, name: str) -> None:
+    """Raise ValidationError if a required parameter is missing or empty."""
+    if not value:
+        raise ValidationError(f"{name} is required")
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Check whether an SLS SDK error is a throttling or transient server error."""
+    status_code = getattr(error, "status_code", None) or getattr(error, "statusCode", None)
+    return status_code in _RETRYABLE_STATUS_CODES
+
+
+def _is_not_found(error: Exception) -> bool:
+    """Check whether an SLS SDK error reports a missing resource."""
+    status_code = getattr(error, "status_code", None) or getattr(error, "statusCode", None)
+    code = getattr(error, "code", None)
+    return status_code == 404 or (
+        isinstance(code, str) and code.endswith(("NotExist", "NotFound"))
+    )
+
+
+def _is_project_not_exist(error: Exception) -> bool:
+    """Check whether an SLS SDK error reports that the project does not exist."""
+    code = getattr(error, "code", None)
+    if code is None:
+        return "ProjectNotExist" in str(error)
+    return code == "ProjectNotExist"
+
+
+def _backoff_delay(attempt: int, initial: float, max_interval: float) -> float:
+    """Exponential backoff delay for the given attempt, with a little jitter."""
+    return min(initial * 2 ** attempt, max_interval) + random.uniform(0, 0.1)
+
+
+def _prepare_messages(
+    messages: Union[str, Dict[str, str], List[Dict[str, str]]]
+) -> List[sls_models.AddMemoriesRequestMessages]:
+    """Convert messages to SLS request format.
+
+    Args:
+        messages: A string, single message dict, or list of message dicts.
+                 If a string is provided, it will be converted to a user message.
+
+    Returns:
+        A list of AddMemoriesRequestMessages objects.
+    """
+    # Fast path for the common single-string form.
+    if isinstance(messages, str):
+        return [sls_models.AddMemoriesRequestMessages(role=DEFAULT_ROLE, content=messages)]
+
+    return [
+        sls_models.AddMemoriesRequestMessages(
+            role=msg.get("role", DEFAULT_ROLE),
+            content=msg.get("content", ""),
+        )
+        for msg in normalize_messages(messages)
+    ]
+
+
+def _build_add_request(
+    messages: List[sls_models.AddMemoriesRequestMessages],
+    user_id: Optional[str] = None,
+    agent_id: Optional[str] = None,
+    app_id: Optional[str] = None,
+    run_id: Optional[str] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+    infer: bool = True,
+    custom_instructions: Optional[str] = None,
+    async_mode: bool = True,
+) -> sls_models.AddMemoriesRequest:
+    """Build the AddMemories request shared by both clients."""
+    return sls_models.AddMemoriesRequest(
+        messages=messages,
+        user_id=user_id,
+        agent_id=agent_id,
+        app_id=app_id,
+        run_id=run_id,
+        metadata=metadata,
+        infer=infer,
+        custom_instructions=custom_instructions,
+        async_mode=async_mode,
+    )
+
+
+def _build_get_all_request(
+    user_id: Optional[str] = None,
+    agent_id: Optional[str] = None,
+    app_id: Optional[str] = None,
+    run_id: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> sls_models.GetMemoriesRequest:
+    """Build the GetMemories request shared by both clients."""
+    return sls_models.GetMemoriesRequest(
+        user_id=user_id,
+        agent_id=agent_id,
+        app_id=app_id,
+        run_id=run_id,
+        limit=limit,
+    )
+
+
+def _build_search_request(
+    query: str,
+    user_id: Optional[str] = None,
+    agent_id: Optional[str] = None,
+    app_id: Optional[str] = None,
+    run_id: Optional[str] = None,
+    top_k: Optional[int] = None,
+    rerank: bool = False,
+) -> sls_models.SearchMemoriesRequest:
+    """Build the SearchMemories request shared by both clients."""
+    return sls_models.SearchMemoriesRequest(
+        query=query,
+        user_id=user_id,
+        agent_id=agent_id,
+        app_id=app_id,
+        run_id=run_id,
+        top_k=top_k,
+        rerank=rerank,
+    )
+
+
+def _build_update_request(
+    text: Optional[str] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> sls_models.UpdateMemoryRequest:
+    """Validate and build the UpdateMemory request shared by both clients."""
+    if text is None and metadata is None:
+        raise ValidationError("Either text or metadata must be provided for update.")
+    return sls_models.UpdateMemoryRequest(
+        text=text,
+        metadata=metadata,
+    )
+
+
+def _build_delete_all_request(
+    user_id: Optional[str] = None,
+    agent_id: Optional[str] = None,
+    app_id: Optional[str] = None,
+    run_id: Optional[str] = None,
+) -> sls_models.DeleteMemoriesRequest:
+    """Build the DeleteMemories request shared by both clients."""
+    return sls_models.DeleteMemoriesRequest(
+        user_id=user_id,
+        agent_id=agent_id,
+        app_id=app_id,
+        run_id=run_id,
+    )
+
+
+def _build_create_memory_store_request(
+    name: str,
+    description: Optional[str] = None,
+    custom_instructions: Optional[str] = None,
+    enable_graph: bool = False,
+    strategy: str = "default",
+    short_term_ttl: int = 7,
+) -> sls_models.CreateMemoryStoreRequest:
+    """Build the CreateMemoryStore request shared by both clients."""
+    return sls_models.CreateMemoryStoreRequest(
+        name=name,
+        description=description,
+        custom_instructions=custom_instructions,
+        enable_graph=enable_graph,
+        strategy=strategy,
+        short_term_ttl=short_term_ttl,
+    )
+
+
+def _build_update_memory_store_request(
+    description: Optional[str] = None,
+    custom_instructions: Optional[str] = None,
+    enable_graph: Optional[bool] = None,
+    strategy: Optional[str] = None,
+    short_term_ttl: Optional[int] = None,
+) -> sls_models.UpdateMemoryStoreRequest:
+    """Build the UpdateMemoryStore request shared by both clients."""
+    return sls_models.UpdateMemoryStoreRequest(
+        description=description,
+        custom_instructions=custom_instructions,
+        enable_graph=enable_graph,
+        strategy=strategy,
+        short_term_ttl=short_term_ttl,
+    )
+
+
+def _status(response: Any) -> Dict[str, Any]:
+    """Build the {"status_code", "headers"} result of a write request."""
+    return {"status_code": response.status_code, "headers": response.headers}
+
+
+def _body_or(response: Any, converter: Callable[[Any], Any], default: Any) -> Any:
+    """Convert the body of an SDK response, or return default if it is empty."""
+    body = response.body
+    return converter(body) if body else default
+
+
+def _to_dict(result: Any) -> Dict[str, Any]:
+    """Convert a plain mapping result to dict format."""
+    return dict(result) if result else {}
+
+
+# `to_map` of each result class that defines one (the SDK models), resolved on
+# first sight of the class so that converting a list of results does not probe
+# each element. Other objects take the per-instance path and are not cached.
+_CONVERTERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {}
+
+
+def _convert_memory_result(result: Any) -> Dict[str, Any]:
+    """Convert SLS memory result to dict format."""
+    converter = _CONVERTERS.get(type(result))
+    if converter is not None:
+        return converter(result)
+    converter = getattr(type(result), "to_map", None)
+    if callable(converter):
+        _CONVERTERS[type(result)] = converter
+        return converter(result)
+    if hasattr(result, "to_map"):
+        return result.to_map()
+    return _to_dict(result)
+
+
+def _convert_results_list(results: List[Any]) -> List[Dict[str, Any]]:
+    """Convert a list of SLS results to dict format."""
+    return list(map(_convert_memory_result, results))
+
+
+def _check_projection(projection: Optional[Iterable[str]]) -> None:
+    """Reject a bare string projection, which would be split into characters."""
+    if isinstance(projection, str):
+        raise ValidationError("projection must be a list of keys, not a string")
+
+
+def _project_results(
+    result: Dict[str, Any], projection: Optional[Iterable[str]]
+) -> Dict[str, Any]:
+    """Keep only the projected keys of each row in a {"results": [...]} result.
+
+    A convenience filter applied after the full conversion, not an optimization.
+    Returns a new dictionary; the input, which may be shared with the result
+    cache or with coalesced callers, is left untouched.
+    """
+    if projection is None:
+        return result
+    keys = tuple(projection)
+    return {
+        **result,
+        "results": [{k: row[k] for k in keys if k in row} for row in result["results"]],
+    }
+
+
+async def _gather_limited(
+    func: Callable[[Any], Awaitable[Any]],
+    items: List[Any],
+    concurrency: int,
+) -> List[Any]:
+    """Run func over items concurrently with at most `concurrency` calls in flight.
+
+    Results are returned in input order; failed calls yield their exception
+    instead of aborting the other calls.
+    """
+    if concurrency <= 0:
+        raise ValidationError("concurrency must be positive")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(item: Any) -> Any:
+        async with semaphore:
+            return await func(item)
+
+    return await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
 
 
 class SLSMemoryClient:
@@ -45,6 +385,9 @@ class SLSMemoryClient:
         config: openapi_models.Config,
         project: str,
         memory_store: str,
+        cache_size: int = 0,
+        cache_ttl: float = 60.0,
+        store_ready_timeout: float = 60.0,
     ):
         """Initialize the SLSMemoryClient.
 
@@ -53,18 +396,32 @@ class SLSMemoryClient:
                    methods including AK/SK, STS Token, Bearer Token, and Credential.
             project: The SLS project name.
             memory_store: The Memory Store name within the project.
+            cache_size: Maximum number of cached read results. Repeated ``search()``
+                       (ignoring whitespace and case in the query), ``get()`` and
+                       ``get_all()`` calls within ``cache_ttl`` are served from the
+                       cache, as is ``describe_memory_store()``. Defaults to 0
+                       (cache disabled).
+            cache_ttl: Time-to-live of cached read results in seconds. Defaults to 60.
+            store_ready_timeout: How long in seconds after ``create_memory_store()``
+                                ``add()`` keeps retrying while the new Memory Store
+                                is not yet writable. Otherwise a missing store is
+                                retried only briefly. Defaults to 60.
 
         Raises:
             ValidationError: If required parameters are missing.
         """
-        if not project:
-            raise ValidationError("project is required")
-        if not memory_store:
-            raise ValidationError("memory_store is required")
+        _require(project, "project")
+        _require(memory_store, "memory_store")
 
-        self._client = SLSClient(config)
+        self._client = _get_sls_client(config)
         self._project = project
         self._memory_store = memory_store
+        self._cache = ResultCache(cache_size, cache_ttl) if cache_size > 0 else None
+        # describe_memory_store() results, kept apart so memory writes do not evict them.
+        self._store_cache = ResultCache(1, cache_ttl) if cache_size > 0 else None
+        self._store_ready_timeout = store_ready_timeout
+        self._ready_deadline = 0.0
+        self._inflight = SingleFlight()
 
     @property
     def project(self) -> str:
@@ -76,45 +433,6 @@ class SLSMemoryClient:
         """Get the Memory Store name."""
         return self._memory_store
 
-    def _prepare_messages(
-        self, messages: Union[str, Dict[str, str], List[Dict[str, str]]]
-    ) -> List[sls_models.AddMemoriesRequestMessages]:
-        """Convert messages to SLS request format.
-
-        Args:
-            messages: A string, single message dict, or list of message dicts.
-                     If a string is provided, it will be converted to a user message.
-
-        Returns:
-            A list of AddMemoriesRequestMessages objects.
-        """
-        if isinstance(messages, str):
-            messages = [{"role": "user", "content": messages}]
-        elif isinstance(messages, dict):
-            messages = [messages]
-        elif not isinstance(messages, list):
-            raise ValidationError(
-                f"messages must be str, dict, or list[dict], got {type(messages).__name__}"
-            )
-
-        result = []
-        for msg in messages:
-            result.append(sls_models.AddMemoriesRequestMessages(
-                role=msg.get("role", "user"),
-                content=msg.get("content", ""),
-            ))
-        return result
-
-    def _convert_memory_result(self, result: Any) -> Dict[str, Any]:
-        """Convert SLS memory result to dict format."""
-        if hasattr(result, 'to_map'):
-            return result.to_map()
-        return dict(result) if result else {}
-
-    def _convert_results_list(self, results: List[Any]) -> List[Dict[str, Any]]:
-        """Convert a list of SLS results to dict format."""
-        return [self._convert_memory_result(r) for r in results] if results else []
-
     def add(
         self,
         messages: Union[str, Dict[str, str], List[Dict[str, str]]],
@@ -153,9 +471,9 @@ class SLSMemoryClient:
             ...     metadata={"source": "chat", "importance": "high"}
             ... )
         """
-        sls_messages = self._prepare_messages(messages)
+        sls_messages = _prepare_messages(messages)
 
-        request = sls_models.AddMemoriesRequest(
+        request = _build_add_request(
             messages=sls_messages,
             user_id=user_id,
             agent_id=agent_id,
@@ -166,16 +484,106 @@ class SLSMemoryClient:
             async_mode=async_mode,
         )
 
-        response = self._client.add_memories(
-            self._project,
-            self._memory_store,
-            request,
-        )
+        # A freshly created Memory Store may take a while to become writable.
+        deadline = max(self._ready_deadline, time.monotonic() + _NOT_FOUND_GRACE)
+        attempt = 0
+        while True:
+            try:
+                response = self._client.add_memories(
+                    self._project,
+                    self._memory_store,
+                    request,
+                )
+                break
+            except Exception as e:
+                delay = _backoff_delay(attempt, 0.05, 2.0)
+                if not _is_not_found(e) or time.monotonic() + delay > deadline:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+        if self._cache is not None:
+            self._cache.invalidate((user_id, agent_id, app_id, run_id))
 
         # Return the response body (async mode format)
-        if response.body:
-            return self._convert_memory_result(response.body)
-        return {"results": []}
+        return _body_or(response, _convert_memory_result, {"results": []})
+
+    def add_batch(
+        self,
+        messages: List[Union[str, Dict[str, str]]],
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        app_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        infer: bool = True,
+        async_mode: bool = True,
+        max_batch_items: int = 500,
+        max_batch_bytes: int = 1024 * 1024,
+    ) -> Dict[str, Any]:
+        """Add many messages with as few requests as possible.
+
+        Messages are packed into ``add()`` requests of at most ``max_batch_items``
+        messages and ``max_batch_bytes`` bytes of content each, so bulk ingestion
+        pays one round trip per chunk instead of one per message. All messages
+        share the same user_id, agent_id, app_id, run_id and metadata.
+
+        Each request is one conversation, so this is not equivalent to calling
+        ``add()`` once per message: with ``infer=True`` the service extracts
+        memories from each chunk as a whole, and chunks are split at arbitrary
+        item and byte boundaries. Pass ``infer=False`` to store unrelated
+        messages verbatim.
+
+        Args:
+            messages: A list of strings or message dictionaries. Strings are
+                     converted to user messages.
+            user_id: The user ID to associate with the memories.
+            agent_id: The agent ID to associate with the memories.
+            app_id: The application ID to associate with the memories.
+            run_id: The run ID to associate with the memories.
+            metadata: Optional metadata to attach to the memories (any key-value pairs).
+            infer: Whether to enable inference mode. Defaults to True.
+            async_mode: Whether to process asynchronously. Defaults to True.
+            max_batch_items: Maximum number of messages per request. Defaults to 500.
+            max_batch_bytes: Maximum size in bytes of message content per request.
+                            Defaults to 1 MiB.
+
+        Returns:
+            A dictionary with the concatenated results of all requests:
+            {"results": [...]}
+
+        Raises:
+            ValidationError: If messages is not a list of strings and dictionaries.
+            Exception: The error of the first failing request, passed through with
+                a ``partial_results`` attribute holding the results of the
+                requests sent before it, in the same format as the return value.
+
+        Example:
+            >>> client.add_batch(
+            ...     ["I love playing tennis", "I live in Hangzhou"],
+            ...     user_id="user123",
+            ... )
+        """
+        messages = normalize_batch(messages)
+
+        results: List[Any] = []
+        for chunk in chunk_messages(messages, max_batch_items, max_batch_bytes):
+            try:
+                response = self.add(
+                    chunk,
+                    user_id=user_id,
+                    agent_id=agent_id,
+                    app_id=app_id,
+                    run_id=run_id,
+                    metadata=metadata,
+                    infer=infer,
+                    async_mode=async_mode,
+                )
+            except Exception as e:
+                # Let callers see what the earlier chunks already stored.
+                e.partial_results = {"results": results}
+                raise
+            results.extend(response.get("results") or [])
+        return {"results": results}
 
     def get(self, memory_id: str) -> Dict[str, Any]:
         """Retrieve a specific memory by ID.
@@ -190,18 +598,28 @@ class SLSMemoryClient:
             >>> memory = client.get("mem_123")
             >>> print(memory["memory"])
         """
-        if not memory_id:
-            raise ValidationError("memory_id is required")
+        _require(memory_id, "memory_id")
+
+        cache_key = ("get", memory_id)
+        if self._cache is not None:
+            cached = self._cache.get(ANY_SCOPE, cache_key)
+            if cached is not None:
+                return cached
 
+        result = self._fetch_memory(memory_id)
+        if self._cache is not None:
+            self._cache.put(ANY_SCOPE, cache_key, result)
+        return result
+
+    def _fetch_memory(self, memory_id: str) -> Dict[str, Any]:
+        """Retrieve a memory from SLS, bypassing the result cache."""
         response = self._client.get_memory(
             self._project,
             self._memory_store,
             memory_id,
         )
 
-        if response.body:
-            return self._convert_memory_result(response.body)
-        return {}
+        return _body_or(response, _convert_memory_result, {})
 
     def get_all(
         self,
@@ -210,6 +628,7 @@ class SLSMemoryClient:
         app_id: Optional[str] = None,
         run_id: Optional[str] = None,
         limit: Optional[int] = None,
+        projection: Optional[Iterable[str]] = None,
     ) -> Dict[str, Any]:
         """Retrieve all memories, with optional filtering.
 
@@ -219,6 +638,10 @@ class SLSMemoryClient:
             app_id: Optional application ID to filter memories.
             run_id: Optional run ID to filter memories.
             limit: Maximum number of memories to retrieve.
+            projection: Optional keys to keep in each returned memory, e.g.
+                       ``["id", "memory"]``, for callers that want smaller result
+                       dictionaries. The full response is still fetched and
+                       converted. Defaults to None (all keys).
 
         Returns:
             A dictionary containing memories in format: {"results": [...]}
@@ -228,7 +651,29 @@ class SLSMemoryClient:
             >>> for mem in memories["results"]:
             ...     print(mem["memory"])
         """
-        request = sls_models.GetMemoriesRequest(
+        _check_projection(projection)
+        scope = (user_id, agent_id, app_id, run_id)
+        cache_key = ("get_all", limit)
+        if self._cache is not None:
+            cached = self._cache.get(scope, cache_key)
+            if cached is not None:
+                return _project_results(cached, projection)
+
+        result = self._fetch_memories(user_id, agent_id, app_id, run_id, limit)
+        if self._cache is not None:
+            self._cache.put(scope, cache_key, result)
+        return _project_results(result, projection)
+
+    def _fetch_memories(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        app_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Retrieve memories from SLS, bypassing the result cache."""
+        request = _build_get_all_request(
             user_id=user_id,
             agent_id=agent_id,
             app_id=app_id,
@@ -244,7 +689,7 @@ class SLSMemoryClient:
 
         result = {"results": []}
         if response.body and response.body.results:
-            result["results"] = self._convert_results_list(response.body.results)
+            result["results"] = _convert_results_list(response.body.results)
 
         return result
 
@@ -257,6 +702,7 @@ class SLSMemoryClient:
         run_id: Optional[str] = None,
         top_k: Optional[int] = None,
         rerank: bool = False,
+        projection: Optional[Iterable[str]] = None,
     ) -> Dict[str, Any]:
         """Search memories based on a query.
 
@@ -268,6 +714,10 @@ class SLSMemoryClient:
             run_id: Optional run ID to filter results.
             top_k: Maximum number of top results to return.
             rerank: Whether to enable reranking. Defaults to False.
+            projection: Optional keys to keep in each returned memory, e.g.
+                       ``["id", "memory"]``, for callers that want smaller result
+                       dictionaries. The full response is still fetched and
+                       converted. Defaults to None (all keys).
 
         Returns:
             A dictionary containing search results in format: {"results": [...]}
@@ -282,30 +732,45 @@ class SLSMemoryClient:
             >>> for mem in results["results"]:
             ...     print(f"{mem['memory']} (score: {mem.get('score', 'N/A')})")
         """
-        if not query:
-            raise ValidationError("query is required")
+        _require(query, "query")
+        _check_projection(projection)
+
+        scope = (user_id, agent_id, app_id, run_id)
+        cache_key = ("search", normalize_query(query), top_k, rerank)
+        if self._cache is not None:
+            cached = self._cache.get(scope, cache_key)
+            if cached is not None:
+                return _project_results(cached, projection)
+
+        def fetch() -> Dict[str, Any]:
+            request = _build_search_request(
+                query=query,
+                user_id=user_id,
+                agent_id=agent_id,
+                app_id=app_id,
+                run_id=run_id,
+                top_k=top_k,
+                rerank=rerank,
+            )
 
-        request = sls_models.SearchMemoriesRequest(
-            query=query,
-            user_id=user_id,
-            agent_id=agent_id,
-            app_id=app_id,
-            run_id=run_id,
-            top_k=top_k,
-            rerank=rerank,
-        )
+            response = self._client.search_memories(
+                self._project,
+                self._memory_store,
+                request,
+            )
 
-        response = self._client.search_memories(
-            self._project,
-            self._memory_store,
-            request,
-        )
+            result = {"results": []}
+            if response.body and response.body.results:
+                result["results"] = _convert_results_list(response.body.results)
 
-        result = {"results": []}
-        if response.body and response.body.results:
-                result["results"] = self._convert_results_list(response.body.results)
+            if self._cache is not None:
+                self._cache.put(scope, cache_key, result)
+            return result
 
-        return result
+        # Concurrent searches for the exact same query share one in-flight
+        # request; query normalization applies only to the opt-in cache.
+        result = self._inflight.do((scope, query, top_k, rerank), fetch)
+        return _project_results(result, projection)
 
     def update(
         self,
@@ -330,12 +795,8 @@ class SLSMemoryClient:
             ...     metadata={"updated_by": "user", "importance": "high"}
             ... )
         """
-        if not memory_id:
-            raise ValidationError("memory_id is required")
-        if text is None and metadata is None:
-            raise ValidationError("Either text or metadata must be provided for update.")
-
-        request = sls_models.UpdateMemoryRequest(
+        _require(memory_id, "memory_id")
+        request = _build_update_request(
             text=text,
             metadata=metadata,
         )
@@ -346,11 +807,10 @@ class SLSMemoryClient:
             memory_id,
             request,
         )
+        if self._cache is not None:
+            self._cache.invalidate()
 
-        return {
-            "status_code": response.status_code,
-            "headers": response.headers,
-        }
+        return _status(response)
 
     def delete(self, memory_id: str) -> Dict[str, Any]:
         """Delete a specific memory by ID.
@@ -364,26 +824,60 @@ class SLSMemoryClient:
         Example:
             >>> client.delete("mem_123")
         """
-        if not memory_id:
-            raise ValidationError("memory_id is required")
+        _require(memory_id, "memory_id")
 
         response = self._client.delete_memory(
             self._project,
             self._memory_store,
             memory_id,
         )
+        if self._cache is not None:
+            self._cache.invalidate()
+
+        return _status(response)
+
+    def delete_many(self, memory_ids: List[str], concurrency: int = 16) -> List[Any]:
+        """Delete several memories by ID concurrently.
+
+        SLS has no bulk delete-by-ID API, so each ID is sent as a separate
+        ``delete()`` request from a pool of ``concurrency`` worker threads.
 
-        return {
-            "status_code": response.status_code,
-            "headers": response.headers,
-        }
+        Args:
+            memory_ids: The IDs of the memories to delete.
+            concurrency: Maximum number of in-flight requests. Defaults to 16.
+
+        Returns:
+            A list with one entry per ID, in input order: the ``delete()``
+            response, or the exception raised for that ID.
+
+        Raises:
+            ValidationError: If concurrency is not positive. A missing ID fails
+                only its own entry.
+
+        Example:
+            >>> client.delete_many(["mem_123", "mem_456"])
+        """
+        if concurrency <= 0:
+            raise ValidationError("concurrency must be positive")
+        if not memory_ids:
+            return []
+
+        def delete_one(memory_id: str) -> Any:
+            try:
+                return self.delete(memory_id)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(memory_ids))) as pool:
+            return list(pool.map(delete_one, memory_ids))
 
     def delete_all(
         self,
         user_id: Optional[str] = None,
         agent_id: Optional[str] = None,
         app_id: Optional[str] = None,
-        run_id: Optional[str] = None
+        run_id: Optional[str] = None,
+        confirm: bool = False,
     ) -> Dict[str, Any]:
         """Delete all memories with optional filtering.
 
@@ -392,17 +886,23 @@ class SLSMemoryClient:
             agent_id: Optional agent ID to filter which memories to delete.
             app_id: Optional application ID to filter which memories to delete.
             run_id: Optional run ID to filter which memories to delete.
+            confirm: Must be True to delete without any filter. Defaults to False.
 
         Returns:
             A dictionary containing the API response.
 
+        Raises:
+            ValidationError: If no filter is provided and confirm is not True.
+
         Warning:
-            If no filters are provided, this will delete ALL memories in the memory store!
+            With no filters and confirm=True, this deletes ALL memories in the memory store!
 
         Example:
             >>> client.delete_all(user_id="user123")  # Delete only user123's memories
         """
-        request = sls_models.DeleteMemoriesRequest(
+        if not confirm and not any((user_id, agent_id, app_id, run_id)):
+            raise ValidationError("delete_all requires at least one filter or confirm=True")
+        request = _build_delete_all_request(
             user_id=user_id,
             agent_id=agent_id,
             app_id=app_id,
@@ -414,11 +914,10 @@ class SLSMemoryClient:
             self._memory_store,
             request,
         )
+        if self._cache is not None:
+            self._cache.invalidate((user_id, agent_id, app_id, run_id))
 
-        return {
-            "status_code": response.status_code,
-            "headers": response.headers,
-        }
+        return _status(response)
 
     def history(self, memory_id: str) -> List[Dict[str, Any]]:
         """Retrieve the history of a specific memory.
@@ -434,8 +933,7 @@ class SLSMemoryClient:
             >>> for entry in history:
             ...     print(f"{entry['event']}: {entry.get('new_memory', 'N/A')}")
         """
-        if not memory_id:
-            raise ValidationError("memory_id is required")
+        _require(memory_id, "memory_id")
 
         response = self._client.get_memory_history(
             self._project,
@@ -443,9 +941,100 @@ class SLSMemoryClient:
             memory_id,
         )
 
-        if response.body:
-            return self._convert_results_list(response.body)
-        return []
+        return _body_or(response, _convert_results_list, [])
+
+    def history_stream(self, memory_id: str) -> Iterator[Dict[str, Any]]:
+        """Iterate over the history of a specific memory.
+
+        Like ``history()``, but entries are converted to dictionaries one at a
+        time as the caller consumes them. This is not true streaming: SLS
+        returns the whole history in one response, and that response body is
+        held in memory until iteration finishes. Only the converted copy is
+        built lazily.
+
+        Args:
+            memory_id: The ID of the memory to retrieve history for.
+
+        Returns:
+            An iterator over dictionaries containing the memory history.
+
+        Example:
+            >>> for entry in client.history_stream("mem_123"):
+            ...     print(entry["event"])
+        """
+        _require(memory_id, "memory_id")
+
+        response = self._client.get_memory_history(
+            self._project,
+            self._memory_store,
+            memory_id,
+        )
+
+        return map(_convert_memory_result, response.body or ())
+
+    def wait_until_indexed(
+        self,
+        memory_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        app_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        min_count: int = 1,
+        timeout: float = 180,
+        initial: float = 0.5,
+        max_interval: float = 5.0,
+    ) -> Dict[str, Any]:
+        """Wait until memories are readable, polling with exponential backoff.
+
+        Memories added with ``async_mode=True`` are processed in the background.
+        If ``memory_id`` is given, this polls ``get(memory_id)`` until the memory
+        exists; otherwise it polls ``get_all()`` with the given filters until at
+        least ``min_count`` memories are returned.
+
+        Args:
+            memory_id: Optional ID of the memory to wait for.
+            user_id: Optional user ID to filter memories.
+            agent_id: Optional agent ID to filter memories.
+            app_id: Optional application ID to filter memories.
+            run_id: Optional run ID to filter memories.
+            min_count: Minimum number of memories to wait for. Defaults to 1.
+            timeout: Maximum time to wait in seconds. Defaults to 180.
+            initial: Initial polling interval in seconds. Defaults to 0.5.
+            max_interval: Maximum polling interval in seconds. Defaults to 5.0.
+
+        Returns:
+            The memory returned by ``get()``, or the ``get_all()`` result.
+
+        Raises:
+            TimeoutError: If the memories are not readable within ``timeout``.
+
+        Example:
+            >>> client.add("I love playing tennis", user_id="user123")
+            >>> client.wait_until_indexed(user_id="user123")
+        """
+        deadline = time.monotonic() + timeout
+        attempt = 0
+        while True:
+            # Poll SLS directly: cached results would not change between attempts.
+            if memory_id:
+                try:
+                    result = self._fetch_memory(memory_id)
+                except Exception as e:
+                    if not _is_not_found(e):
+                        raise
+                    result = {}
+                if result:
+                    return result
+            else:
+                result = self._fetch_memories(user_id, agent_id, app_id, run_id)
+                if len(result["results"]) >= min_count:
+                    return result
+
+            delay = _backoff_delay(attempt, initial, max_interval)
+            if time.monotonic() + delay > deadline:
+                raise TimeoutError(f"memories not indexed within {timeout} seconds")
+            time.sleep(delay)
+            attempt += 1
 
     # Memory Store Management Methods
 
@@ -478,10 +1067,8 @@ class SLSMemoryClient:
             ...     enable_graph=True
             ... )
         """
-        store_name = self._memory_store
-        
-        request = sls_models.CreateMemoryStoreRequest(
-            name=store_name,
+        request = _build_create_memory_store_request(
+            name=self._memory_store,
             description=description,
             custom_instructions=custom_instructions,
             enable_graph=enable_graph,
@@ -495,7 +1082,7 @@ class SLSMemoryClient:
                 request,
             )
         except Exception as e:
-            if "ProjectNotExist" not in str(e):
+            if not _is_project_not_exist(e):
                 raise
             self._client.create_project(
                 sls_models.CreateProjectRequest(
@@ -507,11 +1094,11 @@ class SLSMemoryClient:
                 self._project,
                 request,
             )
+        if self._store_cache is not None:
+            self._store_cache.invalidate()
+        self._ready_deadline = time.monotonic() + self._store_ready_timeout
 
-        return {
-            "status_code": response.status_code,
-            "headers": response.headers,
-        }
+        return _status(response)
 
     def describe_memory_store(self) -> Dict[str, Any]:
         """Get detailed information about the current Memory Store.
@@ -531,14 +1118,20 @@ class SLSMemoryClient:
             >>> info = client.describe_memory_store()
             >>> print(f"Store: {info['name']}, Created: {info['create_time']}")
         """
+        if self._store_cache is not None:
+            cached = self._store_cache.get(ANY_SCOPE, "describe")
+            if cached is not None:
+                return cached
+
         response = self._client.get_memory_store(
             self._project,
             self._memory_store,
         )
 
-        if response.body:
-            return self._convert_memory_result(response.body)
-        return {}
+        result = _body_or(response, _convert_memory_result, {})
+        if self._store_cache is not None:
+            self._store_cache.put(ANY_SCOPE, "describe", result)
+        return result
 
     def update_memory_store(
         self,
@@ -567,7 +1160,7 @@ class SLSMemoryClient:
             ...     short_term_ttl=3600
             ... )
         """
-        request = sls_models.UpdateMemoryStoreRequest(
+        request = _build_update_memory_store_request(
             description=description,
             custom_instructions=custom_instructions,
             enable_graph=enable_graph,
@@ -580,11 +1173,10 @@ class SLSMemoryClient:
             self._memory_store,
             request,
         )
+        if self._store_cache is not None:
+            self._store_cache.invalidate()
 
-        return {
-            "status_code": response.status_code,
-            "headers": response.headers,
-        }
+        return _status(response)
 
     def delete_memory_store(self) -> Dict[str, Any]:
         """Delete the current Memory Store.
@@ -602,11 +1194,12 @@ class SLSMemoryClient:
             self._project,
             self._memory_store,
         )
+        if self._cache is not None:
+            self._cache.invalidate()
+        if self._store_cache is not None:
+            self._store_cache.invalidate()
 
-        return {
-            "status_code": response.status_code,
-            "headers": response.headers,
-        }
+        return _status(response)
 
 
 class AsyncSLSMemoryClient:
@@ -639,6 +1232,11 @@ class AsyncSLSMemoryClient:
         config: openapi_models.Config,
         project: str,
         memory_store: str,
+        cache_size: int = 0,
+        cache_ttl: float = 60.0,
+        max_batch: int = 0,
+        max_delay_ms: float = 10.0,
+        store_ready_timeout: float = 60.0,
     ):
         """Initialize the AsyncSLSMemoryClient.
 
@@ -647,24 +1245,48 @@ class AsyncSLSMemoryClient:
                    methods including AK/SK, STS Token, Bearer Token, and Credential.
             project: The SLS project name.
             memory_store: The Memory Store name within the project.
+            cache_size: Maximum number of cached read results. Defaults to 0
+                       (cache disabled). See SLSMemoryClient.
+            cache_ttl: Time-to-live of cached read results in seconds. Defaults to 60.
+            max_batch: Maximum number of concurrent ``add()`` calls coalesced into one
+                      request. Only calls with ``infer=False`` are coalesced, since
+                      inference over merged messages would change what is stored.
+                      Such calls with the same filters issued within
+                      ``max_delay_ms`` of each other share a request, and each caller
+                      receives the results for its own messages. Defaults to 0
+                      (disabled).
+            max_delay_ms: Maximum time in milliseconds an ``add()`` call waits for
+                         others to batch with. Defaults to 10.
+            store_ready_timeout: How long in seconds after ``create_memory_store()``
+                                ``add()`` keeps retrying while the new Memory Store
+                                is not yet writable. Defaults to 60.
 
         Raises:
             ValidationError: If required parameters are missing.
         """
-        if not project:
-            raise ValidationError("project is required")
-        if not memory_store:
-            raise ValidationError("memory_store is required")
+        _require(project, "project")
+        _require(memory_store, "memory_store")
 
-        self._client = SLSClient(config)
+        self._client = _get_sls_client(config)
         self._project = project
         self._memory_store = memory_store
+        self._cache = ResultCache(cache_size, cache_ttl) if cache_size > 0 else None
+        # describe_memory_store() results, kept apart so memory writes do not evict them.
+        self._store_cache = ResultCache(1, cache_ttl) if cache_size > 0 else None
+        self._store_ready_timeout = store_ready_timeout
+        self._ready_deadline = 0.0
+        self._inflight = AsyncSingleFlight()
+        self._batcher = (
+            _BatchScheduler(self._add_messages, max_batch, max_delay_ms / 1000)
+            if max_batch > 1 else None
+        )
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        pass
+        if self._batcher is not None:
+            await self._batcher.close()
 
     @property
     def project(self) -> str:
@@ -676,37 +1298,6 @@ class AsyncSLSMemoryClient:
         """Get the Memory Store name."""
         return self._memory_store
 
-    def _prepare_messages(
-        self, messages: Union[str, Dict[str, str], List[Dict[str, str]]]
-    ) -> List[sls_models.AddMemoriesRequestMessages]:
-        """Convert messages to SLS request format."""
-        if isinstance(messages, str):
-            messages = [{"role": "user", "content": messages}]
-        elif isinstance(messages, dict):
-            messages = [messages]
-        elif not isinstance(messages, list):
-            raise ValidationError(
-                f"messages must be str, dict, or list[dict], got {type(messages).__name__}"
-            )
-
-        result = []
-        for msg in messages:
-            result.append(sls_models.AddMemoriesRequestMessages(
-                role=msg.get("role", "user"),
-                content=msg.get("content", ""),
-            ))
-        return result
-
-    def _convert_memory_result(self, result: Any) -> Dict[str, Any]:
-        """Convert SLS memory result to dict format."""
-        if hasattr(result, 'to_map'):
-            return result.to_map()
-        return dict(result) if result else {}
-
-    def _convert_results_list(self, results: List[Any]) -> List[Dict[str, Any]]:
-        """Convert a list of SLS results to dict format."""
-        return [self._convert_memory_result(r) for r in results] if results else []
-
     async def add(
         self,
         messages: Union[str, Dict[str, str], List[Dict[str, str]]],
@@ -738,9 +1329,36 @@ class AsyncSLSMemoryClient:
             A dictionary containing the API response in format:
             {"results": [{"message": "...", "status": "PENDING", "event_id": "..."}]}
         """
-        sls_messages = self._prepare_messages(messages)
+        sls_messages = _prepare_messages(messages)
+        scope = dict(
+            user_id=user_id,
+            agent_id=agent_id,
+            app_id=app_id,
+            run_id=run_id,
+            metadata=metadata,
+            infer=infer,
+            custom_instructions=custom_instructions,
+            async_mode=async_mode,
+        )
+        # Messages stored verbatim can share a request; inferred ones cannot.
+        if self._batcher is not None and not infer:
+            return await self._batcher.submit(sls_messages, scope)
+        return await self._add_messages(sls_messages, **scope)
 
-        request = sls_models.AddMemoriesRequest(
+    async def _add_messages(
+        self,
+        sls_messages: List[sls_models.AddMemoriesRequestMessages],
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        app_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        infer: bool = True,
+        custom_instructions: Optional[str] = None,
+        async_mode: bool = True,
+    ) -> Dict[str, Any]:
+        """Send prepared messages in one AddMemories request."""
+        request = _build_add_request(
             messages=sls_messages,
             user_id=user_id,
             agent_id=agent_id,
@@ -752,16 +1370,144 @@ class AsyncSLSMemoryClient:
             async_mode=async_mode,
         )
 
-        response = await self._client.add_memories_async(
-            self._project,
-            self._memory_store,
-            request,
-        )
+        # A freshly created Memory Store may take a while to become writable.
+        deadline = max(self._ready_deadline, time.monotonic() + _NOT_FOUND_GRACE)
+        attempt = 0
+        while True:
+            try:
+                response = await self._client.add_memories_async(
+                    self._project,
+                    self._memory_store,
+                    request,
+                )
+                break
+            except Exception as e:
+                delay = _backoff_delay(attempt, 0.05, 2.0)
+                if not _is_not_found(e) or time.monotonic() + delay > deadline:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+        if self._cache is not None:
+            self._cache.invalidate((user_id, agent_id, app_id, run_id))
 
         # Return the response body (async mode format)
-        if response.body:
-            return self._convert_memory_result(response.body)
-        return {"results": []}
+        return _body_or(response, _convert_memory_result, {"results": []})
+
+    async def add_batch(
+        self,
+        messages: List[Union[str, Dict[str, str]]],
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        app_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        infer: bool = True,
+        custom_instructions: Optional[str] = None,
+        async_mode: bool = True,
+        max_batch_items: int = 500,
+        max_batch_bytes: int = 1024 * 1024,
+    ) -> Dict[str, Any]:
+        """Add many messages with as few requests as possible (async version).
+
+        Messages are packed into ``add()`` requests of at most ``max_batch_items``
+        messages and ``max_batch_bytes`` bytes of content each. Use ``add_many()``
+        instead when each memory needs its own filters or error isolation.
+
+        Each request is one conversation, so this is not equivalent to calling
+        ``add()`` once per message: with ``infer=True`` the service extracts
+        memories from each chunk as a whole, and chunks are split at arbitrary
+        item and byte boundaries. Pass ``infer=False`` to store unrelated
+        messages verbatim.
+
+        Args:
+            messages: A list of strings or message dictionaries. Strings are
+                     converted to user messages.
+            user_id: The user ID to associate with the memories.
+            agent_id: The agent ID to associate with the memories.
+            app_id: The application ID to associate with the memories.
+            run_id: The run ID to associate with the memories.
+            metadata: Optional metadata to attach to the memories (any key-value pairs).
+            infer: Whether to enable inference mode. Defaults to True.
+            custom_instructions: Custom instructions for memory processing.
+            async_mode: Whether to process asynchronously. Defaults to True.
+            max_batch_items: Maximum number of messages per request. Defaults to 500.
+            max_batch_bytes: Maximum size in bytes of message content per request.
+                            Defaults to 1 MiB.
+
+        Returns:
+            A dictionary with the concatenated results of all requests:
+            {"results": [...]}
+
+        Raises:
+            ValidationError: If messages is not a list of strings and dictionaries.
+            Exception: The error of the first failing request, passed through with
+                a ``partial_results`` attribute holding the results of the
+                requests sent before it, in the same format as the return value.
+        """
+        messages = normalize_batch(messages)
+
+        results: List[Any] = []
+        for chunk in chunk_messages(messages, max_batch_items, max_batch_bytes):
+            try:
+                response = await self._add_messages(
+                    _prepare_messages(chunk),
+                    user_id=user_id,
+                    agent_id=agent_id,
+                    app_id=app_id,
+                    run_id=run_id,
+                    metadata=metadata,
+                    infer=infer,
+                    custom_instructions=custom_instructions,
+                    async_mode=async_mode,
+                )
+            except Exception as e:
+                # Let callers see what the earlier chunks already stored.
+                e.partial_results = {"results": results}
+                raise
+            results.extend(response.get("results") or [])
+        return {"results": results}
+
+    async def add_many(
+        self,
+        items: List[Dict[str, Any]],
+        concurrency: int = 16,
+        max_retries: int = 3,
+    ) -> List[Any]:
+        """Add many memories concurrently (async version).
+
+        Each item is sent as a separate ``add()`` request, with at most
+        ``concurrency`` requests in flight, so N inserts take roughly the time of
+        the slowest request instead of the sum of all of them. Requests rejected
+        with a throttling (429) or service unavailable (503) error are retried
+        with jittered exponential backoff. Gateway errors (502/504) are not
+        retried, because the memory may already have been stored.
+
+        Args:
+            items: A list of dictionaries, each holding the keyword arguments
+                  of one ``add()`` call.
+            concurrency: Maximum number of in-flight requests. Defaults to 16.
+            max_retries: Maximum number of retries per item. Defaults to 3.
+
+        Returns:
+            A list with one entry per item, in input order: the ``add()`` response,
+            or the exception raised for that item.
+
+        Example:
+            >>> results = await client.add_many([
+            ...     {"messages": "I love tennis", "user_id": "user123"},
+            ...     {"messages": "I live in Hangzhou", "user_id": "user123"},
+            ... ])
+        """
+        async def add_one(item: Dict[str, Any]) -> Dict[str, Any]:
+            for attempt in range(max_retries + 1):
+                try:
+                    return await self.add(**item)
+                except Exception as e:
+                    if attempt == max_retries or not _is_retryable(e):
+                        raise
+                    await asyncio.sleep(_backoff_delay(attempt, 0.2, 5.0))
+
+        return await _gather_limited(add_one, items, concurrency)
 
     async def get(self, memory_id: str) -> Dict[str, Any]:
         """Retrieve a specific memory by ID (async version).
@@ -772,18 +1518,28 @@ class AsyncSLSMemoryClient:
         Returns:
             A dictionary containing the memory data.
         """
-        if not memory_id:
-            raise ValidationError("memory_id is required")
+        _require(memory_id, "memory_id")
+
+        cache_key = ("get", memory_id)
+        if self._cache is not None:
+            cached = self._cache.get(ANY_SCOPE, cache_key)
+            if cached is not None:
+                return cached
 
+        result = await self._fetch_memory(memory_id)
+        if self._cache is not None:
+            self._cache.put(ANY_SCOPE, cache_key, result)
+        return result
+
+    async def _fetch_memory(self, memory_id: str) -> Dict[str, Any]:
+        """Retrieve a memory from SLS, bypassing the result cache."""
         response = await self._client.get_memory_async(
             self._project,
             self._memory_store,
             memory_id,
         )
 
-        if response.body:
-            return self._convert_memory_result(response.body)
-        return {}
+        return _body_or(response, _convert_memory_result, {})
 
     async def get_all(
         self,
@@ -792,6 +1548,7 @@ class AsyncSLSMemoryClient:
         app_id: Optional[str] = None,
         run_id: Optional[str] = None,
         limit: Optional[int] = None,
+        projection: Optional[Iterable[str]] = None,
     ) -> Dict[str, Any]:
         """Retrieve all memories, with optional filtering (async version).
 
@@ -801,11 +1558,37 @@ class AsyncSLSMemoryClient:
             app_id: Optional application ID to filter memories.
             run_id: Optional run ID to filter memories.
             limit: Maximum number of memories to retrieve.
+            projection: Optional keys to keep in each returned memory, e.g.
+                       ``["id", "memory"]``, for callers that want smaller result
+                       dictionaries. The full response is still fetched and
+                       converted. Defaults to None (all keys).
 
         Returns:
             A dictionary containing memories in format: {"results": [...]}
         """
-        request = sls_models.GetMemoriesRequest(
+        _check_projection(projection)
+        scope = (user_id, agent_id, app_id, run_id)
+        cache_key = ("get_all", limit)
+        if self._cache is not None:
+            cached = self._cache.get(scope, cache_key)
+            if cached is not None:
+                return _project_results(cached, projection)
+
+        result = await self._fetch_memories(user_id, agent_id, app_id, run_id, limit)
+        if self._cache is not None:
+            self._cache.put(scope, cache_key, result)
+        return _project_results(result, projection)
+
+    async def _fetch_memories(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        app_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Retrieve memories from SLS, bypassing the result cache."""
+        request = _build_get_all_request(
             user_id=user_id,
             agent_id=agent_id,
             app_id=app_id,
@@ -821,7 +1604,7 @@ class AsyncSLSMemoryClient:
 
         result = {"results": []}
         if response.body and response.body.results:
-            result["results"] = self._convert_results_list(response.body.results)
+            result["results"] = _convert_results_list(response.body.results)
 
         return result
 
@@ -834,6 +1617,7 @@ class AsyncSLSMemoryClient:
         run_id: Optional[str] = None,
         top_k: Optional[int] = None,
         rerank: bool = False,
+        projection: Optional[Iterable[str]] = None,
     ) -> Dict[str, Any]:
         """Search memories based on a query (async version).
 
@@ -845,34 +1629,53 @@ class AsyncSLSMemoryClient:
             run_id: Optional run ID to filter results.
             top_k: Maximum number of top results to return.
             rerank: Whether to enable reranking. Defaults to False.
+            projection: Optional keys to keep in each returned memory, e.g.
+                       ``["id", "memory"]``, for callers that want smaller result
+                       dictionaries. The full response is still fetched and
+                       converted. Defaults to None (all keys).
 
         Returns:
             A dictionary containing search results in format: {"results": [...]}
         """
-        if not query:
-            raise ValidationError("query is required")
+        _require(query, "query")
+        _check_projection(projection)
+
+        scope = (user_id, agent_id, app_id, run_id)
+        cache_key = ("search", normalize_query(query), top_k, rerank)
+        if self._cache is not None:
+            cached = self._cache.get(scope, cache_key)
+            if cached is not None:
+                return _project_results(cached, projection)
+
+        async def fetch() -> Dict[str, Any]:
+            request = _build_search_request(
+                query=query,
+                user_id=user_id,
+                agent_id=agent_id,
+                app_id=app_id,
+                run_id=run_id,
+                top_k=top_k,
+                rerank=rerank,
+            )
 
-        request = sls_models.SearchMemoriesRequest(
-            query=query,
-            user_id=user_id,
-            agent_id=agent_id,
-            app_id=app_id,
-            run_id=run_id,
-            top_k=top_k,
-            rerank=rerank,
-        )
+            response = await self._client.search_memories_async(
+                self._project,
+                self._memory_store,
+                request,
+            )
 
-        response = await self._client.search_memories_async(
-            self._project,
-            self._memory_store,
-            request,
-        )
+            result = {"results": []}
+            if response.body and response.body.results:
+                result["results"] = _convert_results_list(response.body.results)
 
-        result = {"results": []}
-        if response.body and response.body.results:
-            result["results"] = self._convert_results_list(response.body.results)
+            if self._cache is not None:
+                self._cache.put(scope, cache_key, result)
+            return result
 
-        return result
+        # Concurrent searches for the exact same query share one in-flight
+        # request; query normalization applies only to the opt-in cache.
+        result = await self._inflight.do((scope, query, top_k, rerank), fetch)
+        return _project_results(result, projection)
 
     async def update(
         self,
@@ -890,12 +1693,8 @@ class AsyncSLSMemoryClient:
         Returns:
             A dictionary containing the API response.
         """
-        if not memory_id:
-            raise ValidationError("memory_id is required")
-        if text is None and metadata is None:
-            raise ValidationError("Either text or metadata must be provided for update.")
-
-        request = sls_models.UpdateMemoryRequest(
+        _require(memory_id, "memory_id")
+        request = _build_update_request(
             text=text,
             metadata=metadata,
         )
@@ -906,11 +1705,40 @@ class AsyncSLSMemoryClient:
             memory_id,
             request,
         )
+        if self._cache is not None:
+            self._cache.invalidate()
+
+        return _status(response)
+
+    async def update_many(
+        self,
+        items: List[Dict[str, Any]],
+        concurrency: int = 16,
+    ) -> List[Any]:
+        """Update many memories concurrently (async version).
+
+        Each item is sent as a separate ``update()`` request, with at most
+        ``concurrency`` requests in flight.
+
+        Args:
+            items: A list of dictionaries, each holding the keyword arguments
+                  of one ``update()`` call.
+            concurrency: Maximum number of in-flight requests. Defaults to 16.
+
+        Returns:
+            A list with one entry per item, in input order: the ``update()``
+            response, or the exception raised for that item.
+
+        Example:
+            >>> results = await client.update_many([
+            ...     {"memory_id": "mem_123", "text": "I love badminton"},
+            ...     {"memory_id": "mem_456", "metadata": {"importance": "high"}},
+            ... ])
+        """
+        async def update_one(item: Dict[str, Any]) -> Dict[str, Any]:
+            return await self.update(**item)
 
-        return {
-            "status_code": response.status_code,
-            "headers": response.headers,
-        }
+        return await _gather_limited(update_one, items, concurrency)
 
     async def delete(self, memory_id: str) -> Dict[str, Any]:
         """Delete a specific memory by ID (async version).
@@ -921,19 +1749,37 @@ class AsyncSLSMemoryClient:
         Returns:
             A dictionary containing the API response.
         """
-        if not memory_id:
-            raise ValidationError("memory_id is required")
+        _require(memory_id, "memory_id")
 
         response = await self._client.delete_memory_async(
             self._project,
             self._memory_store,
             memory_id,
         )
+        if self._cache is not None:
+            self._cache.invalidate()
 
-        return {
-            "status_code": response.status_code,
-            "headers": response.headers,
-        }
+        return _status(response)
+
+    async def delete_many(self, memory_ids: List[str], concurrency: int = 16) -> List[Any]:
+        """Delete several memories by ID concurrently (async version).
+
+        SLS has no bulk delete-by-ID API, so each ID is sent as a separate
+        ``delete()`` request, with at most ``concurrency`` requests in flight.
+
+        Args:
+            memory_ids: The IDs of the memories to delete.
+            concurrency: Maximum number of in-flight requests. Defaults to 16.
+
+        Returns:
+            A list with one entry per ID, in input order: the ``delete()``
+            response, or the exception raised for that ID.
+
+        Raises:
+            ValidationError: If concurrency is not positive. A missing ID fails
+                only its own entry.
+        """
+        return await _gather_limited(self.delete, memory_ids, concurrency)
 
     async def delete_all(
         self,
@@ -941,6 +1787,7 @@ class AsyncSLSMemoryClient:
         agent_id: Optional[str] = None,
         app_id: Optional[str] = None,
         run_id: Optional[str] = None,
+        confirm: bool = False,
     ) -> Dict[str, Any]:
         """Delete all memories with optional filtering (async version).
 
@@ -949,14 +1796,20 @@ class AsyncSLSMemoryClient:
             agent_id: Optional agent ID to filter which memories to delete.
             app_id: Optional application ID to filter which memories to delete.
             run_id: Optional run ID to filter which memories to delete.
+            confirm: Must be True to delete without any filter. Defaults to False.
 
         Returns:
             A dictionary containing the API response.
 
+        Raises:
+            ValidationError: If no filter is provided and confirm is not True.
+
         Warning:
-            If no filters are provided, this will delete ALL memories in the memory store!
+            With no filters and confirm=True, this deletes ALL memories in the memory store!
         """
-        request = sls_models.DeleteMemoriesRequest(
+        if not confirm and not any((user_id, agent_id, app_id, run_id)):
+            raise ValidationError("delete_all requires at least one filter or confirm=True")
+        request = _build_delete_all_request(
             user_id=user_id,
             agent_id=agent_id,
             app_id=app_id,
@@ -968,11 +1821,10 @@ class AsyncSLSMemoryClient:
             self._memory_store,
             request,
         )
+        if self._cache is not None:
+            self._cache.invalidate((user_id, agent_id, app_id, run_id))
 
-        return {
-            "status_code": response.status_code,
-            "headers": response.headers,
-        }
+        return _status(response)
 
     async def history(self, memory_id: str) -> List[Dict[str, Any]]:
         """Retrieve the history of a specific memory (async version).
@@ -983,8 +1835,39 @@ class AsyncSLSMemoryClient:
         Returns:
             A list of dictionaries containing the memory history.
         """
-        if not memory_id:
-            raise ValidationError("memory_id is required")
+        _require(memory_id, "memory_id")
+
+        response = await self._client.get_memory_history_async(
+            self._project,
+            self._memory_store,
+            memory_id,
+        )
+
+        return _body_or(response, _convert_results_list, [])
+
+    async def history_stream(self, memory_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over the history of a specific memory (async version).
+
+        An async generator yielding the same entries as ``history()``, converted
+        to dictionaries one at a time as the caller consumes them. This is not
+        true streaming: SLS returns the whole history in one response, which is
+        fetched on the first iteration and held in memory until iteration
+        finishes. Only the converted copy is built lazily.
+
+        Args:
+            memory_id: The ID of the memory to retrieve history for.
+
+        Yields:
+            Dictionaries containing the memory history.
+
+        Raises:
+            ValidationError: On the first iteration, if memory_id is missing.
+
+        Example:
+            >>> async for entry in client.history_stream("mem_123"):
+            ...     print(entry["event"])
+        """
+        _require(memory_id, "memory_id")
 
         response = await self._client.get_memory_history_async(
             self._project,
@@ -992,9 +1875,84 @@ class AsyncSLSMemoryClient:
             memory_id,
         )
 
-        if response.body:
-            return self._convert_results_list(response.body)
-        return []
+        for entry in response.body or ():
+            yield _convert_memory_result(entry)
+
+    async def history_many(
+        self,
+        memory_ids: List[str],
+        concurrency: int = 16,
+    ) -> List[Any]:
+        """Retrieve the history of several memories concurrently (async version).
+
+        Args:
+            memory_ids: The IDs of the memories to retrieve history for.
+            concurrency: Maximum number of in-flight requests. Defaults to 16.
+
+        Returns:
+            A list with one entry per ID, in input order: the ``history()``
+            result, or the exception raised for that ID.
+
+        Raises:
+            ValidationError: If concurrency is not positive. A missing ID fails
+                only its own entry.
+        """
+        return await _gather_limited(self.history, memory_ids, concurrency)
+
+    async def wait_until_indexed(
+        self,
+        memory_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        app_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        min_count: int = 1,
+        timeout: float = 180,
+        initial: float = 0.5,
+        max_interval: float = 5.0,
+    ) -> Dict[str, Any]:
+        """Wait until memories are readable, polling with exponential backoff (async version).
+
+        Args:
+            memory_id: Optional ID of the memory to wait for.
+            user_id: Optional user ID to filter memories.
+            agent_id: Optional agent ID to filter memories.
+            app_id: Optional application ID to filter memories.
+            run_id: Optional run ID to filter memories.
+            min_count: Minimum number of memories to wait for. Defaults to 1.
+            timeout: Maximum time to wait in seconds. Defaults to 180.
+            initial: Initial polling interval in seconds. Defaults to 0.5.
+            max_interval: Maximum polling interval in seconds. Defaults to 5.0.
+
+        Returns:
+            The memory returned by ``get()``, or the ``get_all()`` result.
+
+        Raises:
+            TimeoutError: If the memories are not readable within ``timeout``.
+        """
+        deadline = time.monotonic() + timeout
+        attempt = 0
+        while True:
+            # Poll SLS directly: cached results would not change between attempts.
+            if memory_id:
+                try:
+                    result = await self._fetch_memory(memory_id)
+                except Exception as e:
+                    if not _is_not_found(e):
+                        raise
+                    result = {}
+                if result:
+                    return result
+            else:
+                result = await self._fetch_memories(user_id, agent_id, app_id, run_id)
+                if len(result["results"]) >= min_count:
+                    return result
+
+            delay = _backoff_delay(attempt, initial, max_interval)
+            if time.monotonic() + delay > deadline:
+                raise TimeoutError(f"memories not indexed within {timeout} seconds")
+            await asyncio.sleep(delay)
+            attempt += 1
 
     # Memory Store Management Methods (Async)
 
@@ -1021,10 +1979,8 @@ class AsyncSLSMemoryClient:
         Returns:
             A dictionary containing the API response.
         """
-        store_name = self._memory_store
-        
-        request = sls_models.CreateMemoryStoreRequest(
-            name=store_name,
+        request = _build_create_memory_store_request(
+            name=self._memory_store,
             description=description,
             custom_instructions=custom_instructions,
             enable_graph=enable_graph,
@@ -1038,7 +1994,7 @@ class AsyncSLSMemoryClient:
                 request,
             )
         except Exception as e:
-            if "ProjectNotExist" not in str(e):
+            if not _is_project_not_exist(e):
                 raise
             await self._client.create_project_async(
                 sls_models.CreateProjectRequest(
@@ -1050,11 +2006,11 @@ class AsyncSLSMemoryClient:
                 self._project,
                 request,
             )
+        if self._store_cache is not None:
+            self._store_cache.invalidate()
+        self._ready_deadline = time.monotonic() + self._store_ready_timeout
 
-        return {
-            "status_code": response.status_code,
-            "headers": response.headers,
-        }
+        return _status(response)
 
     async def describe_memory_store(self) -> Dict[str, Any]:
         """Get detailed information about the current Memory Store (async version).
@@ -1070,14 +2026,20 @@ class AsyncSLSMemoryClient:
             - create_time: Creation timestamp
             - update_time: Last update timestamp
         """
+        if self._store_cache is not None:
+            cached = self._store_cache.get(ANY_SCOPE, "describe")
+            if cached is not None:
+                return cached
+
         response = await self._client.get_memory_store_async(
             self._project,
             self._memory_store,
         )
 
-        if response.body:
-            return self._convert_memory_result(response.body)
-        return {}
+        result = _body_or(response, _convert_memory_result, {})
+        if self._store_cache is not None:
+            self._store_cache.put(ANY_SCOPE, "describe", result)
+        return result
 
     async def update_memory_store(
         self,
@@ -1099,7 +2061,7 @@ class AsyncSLSMemoryClient:
         Returns:
             A dictionary containing the API response.
         """
-        request = sls_models.UpdateMemoryStoreRequest(
+        request = _build_update_memory_store_request(
             description=description,
             custom_instructions=custom_instructions,
             enable_graph=enable_graph,
@@ -1112,11 +2074,10 @@ class AsyncSLSMemoryClient:
             self._memory_store,
             request,
         )
+        if self._store_cache is not None:
+            self._store_cache.invalidate()
 
-        return {
-            "status_code": response.status_code,
-            "headers": response.headers,
-        }
+        return _status(response)
 
     async def delete_memory_store(self) -> Dict[str, Any]:
         """Delete the current Memory Store (async version).
@@ -1131,8 +2092,9 @@ class AsyncSLSMemoryClient:
             self._project,
             self._memory_store,
         )
+        if self._cache is not None:
+            self._cache.invalidate()
+        if self._store_cache is not None:
+            self._store_cache.invalidate()
 
-        return {
-            "status_code": response.status_code,
-            "headers": response.headers,
-        }
+        return _status(response)
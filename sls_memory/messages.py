@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Message normalization for SLS Memory SDK.
+
+This module converts the message forms accepted by ``add()`` and its batching
+variants into lists of message dictionaries, and measures and chunks them for
+batched requests. It is shared by the clients and BatchingWriter.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Union
+
+from sls_memory.exceptions import ValidationError
+
+# Role given to messages passed as plain strings or dicts without a role.
+DEFAULT_ROLE = "user"
+
+
+def normalize_messages(
+    messages: Union[str, Dict[str, str], List[Dict[str, str]]]
+) -> List[Dict[str, str]]:
+    """Convert the messages accepted by ``add()`` to a list of message dicts.
+
+    Raises:
+        ValidationError: If messages is not a str, dict, or list of dicts.
+    """
+    if isinstance(messages, str):
+        return [{"role": DEFAULT_ROLE, "content": messages}]
+    if isinstance(messages, dict):
+        return [messages]
+    if not isinstance(messages, list):
+        raise ValidationError(
+            f"messages must be str, dict, or list[dict], got {type(messages).__name__}"
+        )
+    for msg in messages:
+        if not isinstance(msg, dict):
+            raise ValidationError(
+                f"messages must be str, dict, or list[dict], got an item of type "
+                f"{type(msg).__name__}"
+            )
+    return messages
+
+
+def normalize_batch(messages: List[Union[str, Dict[str, str]]]) -> List[Dict[str, str]]:
+    """Convert the messages accepted by ``add_batch()`` to a list of message dicts.
+
+    Raises:
+        ValidationError: If messages is not a list of strs and dicts.
+    """
+    if not isinstance(messages, list):
+        raise ValidationError(
+            f"messages must be list[str | dict], got {type(messages).__name__}"
+        )
+    batch = []
+    for msg in messages:
+        if isinstance(msg, str):
+            msg = {"role": DEFAULT_ROLE, "content": msg}
+        elif not isinstance(msg, dict):
+            raise ValidationError(
+                f"messages must be list[str | dict], got an item of type {type(msg).__name__}"
+            )
+        batch.append(msg)
+    return batch
+
+
+def content_size(msg: Dict[str, Any]) -> int:
+    """Return the UTF-8 size of a message's content; non-string content counts as 0."""
+    content = msg.get("content")
+    return len(content.encode("utf-8")) if isinstance(content, str) else 0
+
+
+def chunk_messages(
+    messages: List[Dict[str, str]],
+    max_batch_items: int,
+    max_batch_bytes: int,
+) -> Iterator[List[Dict[str, str]]]:
+    """Split messages into chunks bounded by item count and content size in bytes.
+
+    A single message larger than ``max_batch_bytes`` is sent in a chunk of its own.
+    """
+    if max_batch_items <= 0:
+        raise ValidationError("max_batch_items must be positive")
+    if max_batch_bytes <= 0:
+        raise ValidationError("max_batch_bytes must be positive")
+
+    chunk: List[Dict[str, str]] = []
+    chunk_bytes = 0
+    for msg in messages:
+        size = content_size(msg)
+        if chunk and (len(chunk) >= max_batch_items or chunk_bytes + size > max_batch_bytes):
+            yield chunk
+            chunk, chunk_bytes = [], 0
+        chunk.append(msg)
+        chunk_bytes += size
+    if chunk:
+        yield chunk
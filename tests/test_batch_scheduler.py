@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""Tests for the add() coalescing of AsyncSLSMemoryClient."""
+import asyncio
+import types
+import unittest
+from unittest import mock
+
+from sls_memory import client as client_module
+from sls_memory.batching import _BatchScheduler
+
+
+class FakeSend:
+    """Stand-in for AsyncSLSMemoryClient._add_messages returning one result per message."""
+
+    def __init__(self, fail_for=None, results_per_request=None):
+        self.calls = []
+        self._fail_for = fail_for
+        self._results_per_request = results_per_request
+
+    async def __call__(self, messages, **scope):
+        self.calls.append((list(messages), scope))
+        await asyncio.sleep(0)
+        if scope.get("user_id") == self._fail_for:
+            raise RuntimeError(f"send failed for {self._fail_for}")
+        results = [{"message": m, "status": "PENDING"} for m in messages]
+        if self._results_per_request is not None:
+            results = results[:self._results_per_request]
+        return {"results": results}
+
+
+def _run_callers(send, callers, max_batch=10):
+    async def scenario():
+        scheduler = _BatchScheduler(send, max_batch=max_batch, max_delay=0.01)
+        return await asyncio.gather(
+            *(scheduler.submit(messages, scope) for messages, scope in callers),
+            return_exceptions=True,
+        )
+
+    return asyncio.run(scenario())
+
+
+class BatchSchedulerTest(unittest.TestCase):
+    def test_each_caller_receives_the_results_for_its_own_messages(self):
+        send = FakeSend()
+        scope = {"user_id": "u1"}
+        results = _run_callers(send, [(["a"], scope), (["b", "c"], scope), (["d"], scope)])
+
+        self.assertEqual(len(send.calls), 1)
+        self.assertEqual(send.calls[0][0], ["a", "b", "c", "d"])
+        self.assertEqual(
+            [[r["message"] for r in result["results"]] for result in results],
+            [["a"], ["b", "c"], ["d"]],
+        )
+
+    def test_callers_receive_the_whole_response_when_counts_do_not_match(self):
+        send = FakeSend(results_per_request=1)
+        scope = {"user_id": "u1"}
+        results = _run_callers(send, [(["a"], scope), (["b"], scope)])
+
+        self.assertEqual(results, [{"results": [{"message": "a", "status": "PENDING"}]}] * 2)
+        self.assertIsNot(results[0], results[1])
+
+    def test_calls_with_different_scopes_are_sent_separately(self):
+        send = FakeSend()
+        results = _run_callers(
+            send, [(["a"], {"user_id": "u1"}), (["b"], {"user_id": "u2"})]
+        )
+
+        self.assertEqual([messages for messages, _ in send.calls], [["a"], ["b"]])
+        self.assertEqual(
+            [[r["message"] for r in result["results"]] for result in results], [["a"], ["b"]]
+        )
+
+    def test_a_failed_request_only_fails_its_own_callers(self):
+        send = FakeSend(fail_for="u1")
+        results = _run_callers(
+            send,
+            [(["a"], {"user_id": "u1"}), (["b"], {"user_id": "u2"}), (["c"], {"user_id": "u1"})],
+        )
+
+        self.assertIsInstance(results[0], RuntimeError)
+        self.assertIsInstance(results[2], RuntimeError)
+        self.assertEqual(results[1]["results"][0]["message"], "b")
+
+
+class FakeSLSClient:
+    """Stand-in for the SLS SDK client recording AddMemories requests."""
+
+    def __init__(self):
+        self.requests = []
+
+    async def add_memories_async(self, project, memory_store, request):
+        self.requests.append(request)
+        await asyncio.sleep(0)
+        body = {"results": [{"message": m.content, "status": "PENDING"} for m in request.messages]}
+        return types.SimpleNamespace(status_code=200, headers={}, body=body)
+
+
+class AsyncClientBatchingTest(unittest.TestCase):
+    def setUp(self):
+        self.sdk = FakeSLSClient()
+        fake_models = types.SimpleNamespace(
+            AddMemoriesRequest=types.SimpleNamespace,
+            AddMemoriesRequestMessages=types.SimpleNamespace,
+        )
+        for patcher in (
+            mock.patch.object(client_module, "_get_sls_client", lambda config: self.sdk),
+            mock.patch.object(client_module, "sls_models", fake_models),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _add_concurrently(self, calls):
+        async def scenario():
+            async with client_module.AsyncSLSMemoryClient(
+                None, project="p", memory_store="s", max_batch=10
+            ) as memory:
+                return await asyncio.gather(*(memory.add(m, **kw) for m, kw in calls))
+
+        return asyncio.run(scenario())
+
+    def test_verbatim_adds_share_a_request_and_results_are_split(self):
+        results = self._add_concurrently([
+            ("I live in Hangzhou", {"user_id": "u1", "infer": False}),
+            ([{"role": "user", "content": "I love tennis"},
+              {"role": "assistant", "content": "Noted"}], {"user_id": "u1", "infer": False}),
+        ])
+
+        self.assertEqual(len(self.sdk.requests), 1)
+        self.assertEqual(
+            [[r["message"] for r in result["results"]] for result in results],
+            [["I live in Hangzhou"], ["I love tennis", "Noted"]],
+        )
+
+    def test_inferred_adds_are_never_merged(self):
+        results = self._add_concurrently([
+            ("I live in Hangzhou", {"user_id": "u1"}),
+            ("I love tennis", {"user_id": "u1"}),
+        ])
+
+        self.assertEqual(
+            [[m.content for m in request.messages] for request in self.sdk.requests],
+            [["I live in Hangzhou"], ["I love tennis"]],
+        )
+        self.assertEqual(
+            [[r["message"] for r in result["results"]] for result in results],
+            [["I live in Hangzhou"], ["I love tennis"]],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""Tests for sls_memory.batching.BatchingWriter."""
+import gc
+import threading
+import unittest
+import weakref
+
+from sls_memory.batching import BatchingWriter
+from sls_memory.exceptions import ValidationError
+
+
+class FakeClient:
+    """Stand-in for SLSMemoryClient recording add() calls.
+
+    The first call blocks until ``release()`` so that memories added meanwhile
+    queue up and are sent together, as they would behind a slow request.
+    """
+
+    def __init__(self, fail_for=()):
+        self.calls = []
+        self._fail_for = set(fail_for)
+        self._started = threading.Event()
+        self._gate = threading.Event()
+
+    def add(self, messages, user_id=None, **kwargs):
+        self._started.set()
+        self._gate.wait()
+        self.calls.append((user_id, [m["content"] for m in messages], kwargs["infer"]))
+        if user_id in self._fail_for:
+            raise RuntimeError(f"add failed for {user_id}")
+        return {"results": []}
+
+    def wait_until_busy(self):
+        self._started.wait()
+
+    def release(self):
+        self._gate.set()
+
+
+class BatchingWriterTest(unittest.TestCase):
+    def _writer(self, client, **kwargs):
+        writer = BatchingWriter(client, **kwargs)
+        self.addCleanup(writer.close)
+        # Hold the background thread in a first request while the test queues more.
+        writer.add("first", user_id="u0", infer=False)
+        client.wait_until_busy()
+        return writer
+
+    def test_verbatim_memories_with_the_same_scope_share_a_request(self):
+        client = FakeClient()
+        writer = self._writer(client)
+        writer.add("a", user_id="u1", infer=False)
+        writer.add({"role": "user", "content": "b"}, user_id="u1", infer=False)
+        writer.add("c", user_id="u2", infer=False)
+        client.release()
+        writer.flush()
+
+        self.assertEqual(client.calls, [
+            ("u0", ["first"], False),
+            ("u1", ["a", "b"], False),
+            ("u2", ["c"], False),
+        ])
+
+    def test_inferred_memories_are_sent_one_per_request(self):
+        client = FakeClient()
+        writer = self._writer(client)
+        writer.add("a", user_id="u1")
+        writer.add("b", user_id="u1")
+        client.release()
+        writer.flush()
+
+        self.assertEqual(client.calls[1:], [("u1", ["a"], True), ("u1", ["b"], True)])
+
+    def test_batch_limits_split_requests(self):
+        client = FakeClient()
+        writer = self._writer(client, max_batch_items=2)
+        for content in "abc":
+            writer.add(content, user_id="u1", infer=False)
+        client.release()
+        writer.flush()
+
+        self.assertEqual(client.calls[1:], [("u1", ["a", "b"], False), ("u1", ["c"], False)])
+
+    def test_a_failed_batch_does_not_drop_later_batches(self):
+        client = FakeClient(fail_for={"u1"})
+        writer = self._writer(client)
+        writer.add("a", user_id="u1", infer=False)
+        writer.add("b", user_id="u2", infer=False)
+        client.release()
+
+        with self.assertRaisesRegex(RuntimeError, "u1"):
+            writer.flush()
+        self.assertEqual(client.calls[1:], [("u1", ["a"], False), ("u2", ["b"], False)])
+        # The error is reported once.
+        writer.flush()
+
+    def test_flush_reports_the_first_error(self):
+        client = FakeClient(fail_for={"u1", "u3"})
+        writer = self._writer(client)
+        writer.add("a", user_id="u1", infer=False)
+        writer.add("b", user_id="u2", infer=False)
+        writer.add("c", user_id="u3", infer=False)
+        client.release()
+
+        with self.assertRaisesRegex(RuntimeError, "u1"):
+            writer.flush()
+        self.assertEqual([user_id for user_id, _, _ in client.calls], ["u0", "u1", "u2", "u3"])
+
+    def test_add_after_close_is_rejected(self):
+        client = FakeClient()
+        client.release()
+        writer = BatchingWriter(client)
+        writer.close()
+
+        with self.assertRaises(ValidationError):
+            writer.add("a", user_id="u1")
+
+    def test_closed_writer_is_not_kept_alive(self):
+        client = FakeClient()
+        client.release()
+        writer = BatchingWriter(client)
+        writer.add("a", user_id="u1")
+        writer.close()
+        ref = weakref.ref(writer)
+        del writer
+        gc.collect()
+
+        self.assertIsNone(ref())
+        self.assertEqual(client.calls, [("u1", ["a"], True)])
+
+
+if __name__ == "__main__":
+    unittest.main()
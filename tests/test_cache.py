@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""Tests for the single-flight helpers in sls_memory.cache."""
+import asyncio
+import threading
+import unittest
+
+from sls_memory.cache import AsyncSingleFlight, SingleFlight
+
+
+class SingleFlightTest(unittest.TestCase):
+    def test_concurrent_callers_share_one_call(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def leader_func():
+            calls.append("leader")
+            started.set()
+            release.wait()
+            return {"results": [1]}
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do("k", leader_func)))
+        leader.start()
+        started.wait()
+        follower = threading.Thread(
+            target=lambda: results.append(flight.do("k", lambda: calls.append("follower")))
+        )
+        follower.start()
+        release.set()
+        leader.join()
+        follower.join()
+
+        self.assertEqual(calls, ["leader"])
+        self.assertEqual(results, [{"results": [1]}, {"results": [1]}])
+        self.assertIsNot(results[0], results[1])
+
+
+class AsyncSingleFlightTest(unittest.TestCase):
+    def test_followers_receive_copies_of_the_leader_result(self):
+        async def scenario():
+            flight = AsyncSingleFlight()
+            calls = []
+
+            async def func():
+                calls.append(1)
+                await asyncio.sleep(0)
+                return {"results": []}
+
+            results = await asyncio.gather(*(flight.do("k", func) for _ in range(3)))
+            return calls, results
+
+        calls, results = asyncio.run(scenario())
+        self.assertEqual(calls, [1])
+        self.assertEqual(results, [{"results": []}] * 3)
+        self.assertEqual(len({id(r) for r in results}), 3)
+
+    def test_followers_receive_the_leader_error(self):
+        async def scenario():
+            flight = AsyncSingleFlight()
+
+            async def func():
+                await asyncio.sleep(0)
+                raise RuntimeError("boom")
+
+            return await asyncio.gather(
+                flight.do("k", func), flight.do("k", func), return_exceptions=True
+            )
+
+        results = asyncio.run(scenario())
+        self.assertEqual([str(r) for r in results], ["boom", "boom"])
+
+    def test_follower_reruns_the_call_when_the_leader_is_cancelled(self):
+        async def scenario():
+            flight = AsyncSingleFlight()
+            leader_started = asyncio.Event()
+            calls = []
+
+            async def leader_func():
+                calls.append("leader")
+                leader_started.set()
+                await asyncio.Event().wait()
+
+            async def follower_func():
+                calls.append("follower")
+                await asyncio.sleep(0)
+                return {"results": ["ok"]}
+
+            leader = asyncio.ensure_future(flight.do("k", leader_func))
+            await leader_started.wait()
+            followers = [
+                asyncio.ensure_future(flight.do("k", follower_func)) for _ in range(2)
+            ]
+            await asyncio.sleep(0)
+            leader.cancel()
+            results = await asyncio.gather(*followers)
+            with self.assertRaises(asyncio.CancelledError):
+                await leader
+            return calls, results, flight
+
+        calls, results, flight = asyncio.run(scenario())
+        self.assertEqual(calls, ["leader", "follower"])
+        self.assertEqual(results, [{"results": ["ok"]}] * 2)
+        self.assertEqual(flight._futures, {})
+
+
+if __name__ == "__main__":
+    unittest.main()